@@ -24,7 +24,13 @@ GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "kangnam-backend")
 VERTEX_AI_LOCATION = os.getenv("VERTEX_AI_LOCATION", "us-east4")
 
 # Database 설정
+# PgBouncer(Supabase Pooler) 트랜잭션 모드 주소 사용 (예: ...pooler.supabase.com:6543)
 DATABASE_URL = os.getenv("DATABASE_URL")
+# 커넥션 풀링은 PgBouncer가 담당하므로 워커별 풀은 작게 유지
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+# PgBouncer를 거치지 않는 Postgres 직접 주소 (헬스체크 전용, 미설정 시 DATABASE_URL 사용)
+DIRECT_DATABASE_URL = os.getenv("DIRECT_DATABASE_URL")
 
 # OAuth 설정
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
@@ -6,6 +6,7 @@ FastAPI 백엔드 - Agent Engine과 연동
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 from starlette.middleware.sessions import SessionMiddleware
 
@@ -13,6 +14,11 @@ from starlette.middleware.sessions import SessionMiddleware
 from routers.sessions import router as sessions_router
 from routers.chat import router as chat_router
 from routers.auth import router as auth_router
+from routers.auth.oauth_config import (
+    oauth_transport,
+    start_metadata_refresh,
+    stop_metadata_refresh
+)
 from routers import database
 
 import config
@@ -25,6 +31,8 @@ app = FastAPI(
     title="Kangnam Agent API",
     description="강남대학교 Multi-Agent 챗봇 API",
     version="2.0.0",
+    # orjson으로 JSON 직렬화 (UUID, datetime 네이티브 지원)
+    default_response_class=ORJSONResponse,
     # Swagger UI에 Bearer 인증 추가
     swagger_ui_parameters={
         "persistAuthorization": True
@@ -49,6 +57,17 @@ app.include_router(chat_router)
 app.include_router(auth_router)
 app.include_router(database.router, prefix="/db", tags=["database"])
 
+@app.on_event("startup")
+async def prefetch_oauth_metadata():
+    """Google OpenID discovery 문서와 JWKS를 미리 불러와 캐시 (24시간마다 갱신)"""
+    await start_metadata_refresh()
+
+@app.on_event("shutdown")
+async def close_oauth_transport():
+    """메타데이터 갱신 중지 및 OAuth 공유 HTTP 커넥션 풀 정리"""
+    await stop_metadata_refresh()
+    await oauth_transport.close()
+
 # 헬스체크 (Cloud Run 필수)
 @app.get("/health")
 async def health_check():
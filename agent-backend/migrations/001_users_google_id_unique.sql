@@ -0,0 +1,4 @@
+-- upsert_user의 INSERT ... ON CONFLICT (google_id) 를 위한 UNIQUE 인덱스
+-- Supabase SQL Editor에서 실행 (CONCURRENTLY는 트랜잭션 밖에서 실행해야 함)
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS users_google_id_key
+    ON users (google_id);
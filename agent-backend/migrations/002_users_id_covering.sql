@@ -0,0 +1,11 @@
+-- get_user_by_id (/auth/me) 조회를 Index Only Scan으로 처리하기 위한 커버링 인덱스
+-- CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 이 문장만 단독으로 실행
+-- (Supabase SQL Editor에서 다른 문장과 함께 실행하지 말 것, 또는 psql -f 로 실행)
+-- users_google_id_key(UNIQUE)는 001_users_google_id_unique.sql 에서 생성
+-- 인덱스 생성 후 003_users_vacuum_analyze.sql 을 실행
+CREATE INDEX CONCURRENTLY IF NOT EXISTS users_id_covering
+    ON users (id) INCLUDE (sid, google_id, email, name, created_at, updated_at);
+
+-- 확인: 실행 계획에 "Index Only Scan using users_id_covering" 이 나와야 함
+-- EXPLAIN SELECT id, sid, google_id, email, name, created_at, updated_at
+-- FROM users WHERE id = 1;
@@ -0,0 +1,4 @@
+-- 002의 커버링 인덱스가 Index Only Scan으로 쓰이도록 통계/visibility map 갱신
+-- VACUUM은 트랜잭션 블록 안에서 실행할 수 없으므로 이 문장만 단독으로 실행
+-- (Supabase SQL Editor에서 다른 문장과 함께 실행하지 말 것, 또는 psql -f 로 실행)
+VACUUM ANALYZE users;
@@ -3,33 +3,62 @@ GET /auth/me - 현재 로그인된 사용자 정보 조회
 """
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
 
-from utils.jwt import verify_token
+from utils.jwt import verify_token_cached
 from routers.database import get_db
-from .helpers import get_user_by_id
+from .helpers import get_user_by_id_cached
 
 router = APIRouter()
 security = HTTPBearer()
 
 
-@router.get("/me")
+class MeResponse(BaseModel):
+    """
+    현재 사용자 정보 응답
+
+    토큰 경로에서는 id, email, name만 채워지고,
+    DB 경로(refresh 또는 프로필 없는 토큰)에서는 나머지 필드도 채워집니다.
+    """
+    id: str
+    email: str
+    name: Optional[str]
+    sid: Optional[UUID] = None
+    google_id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+@router.get("/me", response_model=MeResponse)
 async def get_me(
+    refresh: bool = False,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
     """
     현재 로그인된 사용자 정보 조회
     
+    토큰에 프로필(email, name)이 포함되어 있으면 DB 조회 없이 반환합니다.
+    
     Headers:
         Authorization: Bearer {access_token}
     
+    Query Parameters:
+        refresh: True이면 토큰 내용과 캐시 대신 DB에서 최신 정보를 조회 (기본값: False)
+    
     Returns:
-        사용자 정보 (id, email, name 등)
+        id: 사용자 ID (문자열)
+        email: 이메일 주소
+        name: 사용자 이름
+        sid, google_id, created_at, updated_at: DB 조회 시에만 포함 (토큰 경로에서는 null)
     """
     # JWT 검증
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
     
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
@@ -38,9 +67,23 @@ async def get_me(
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token payload")
     
-    # DB에서 사용자 정보 조회
-    user = await get_user_by_id(db, user_id)
+    # 문자열이든 숫자든 항상 int로 변환 (asyncpg는 BIGINT 파라미터에 정수만 허용)
+    try:
+        user_id = int(user_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=401, detail="Invalid user_id format in token")
+    
+    # 토큰에 담긴 프로필 반환 (DB 조회 생략)
+    if not refresh and payload.get("email"):
+        return MeResponse(
+            id=str(user_id),
+            email=payload["email"],
+            name=payload.get("name")
+        )
+    
+    # DB에서 사용자 정보 조회 (refresh 시 캐시를 건너뛰고 DB 값으로 캐시 갱신)
+    user = await get_user_by_id_cached(db, str(user_id), refresh=refresh)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return user
+    return MeResponse(**user)
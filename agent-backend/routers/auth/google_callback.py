@@ -1,7 +1,11 @@
 """
 GET /auth/google/callback - Google OAuth 콜백 처리
 """
+import httpx
+from authlib.integrations.starlette_client import OAuthError
+from authlib.jose.errors import JoseError
 from fastapi import APIRouter, HTTPException, Request, Depends
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from routers.database import get_db
@@ -19,38 +23,51 @@ async def google_callback(request: Request, db: AsyncSession = Depends(get_db)):
     
     Google로부터 인증 코드를 받아 토큰으로 교환하고,
     사용자 정보를 DB에 저장한 후 JWT 토큰을 반환합니다.
+    
+    Raises:
+        400: Google 사용자 정보 누락
+        401: OAuth 인증 실패 (State 불일치, 코드 만료 등 - 재로그인 필요)
+        503: Google 통신 오류 또는 DB 오류 (재시도 가능)
     """
     try:
         # 토큰 교환 및 검증 (Authlib이 State 검증 자동 수행)
         token = await oauth.google.authorize_access_token(request)
-        
-        # 사용자 정보 가져오기
-        user_info = token.get('userinfo')
-        if not user_info:
-            raise HTTPException(status_code=400, detail="Failed to get user info")
-        
-        google_id = user_info.get('sub')
-        email = user_info.get('email')
-        name = user_info.get('name', email.split('@')[0])
-        
-        # DB에 사용자 정보 저장/업데이트
+    except (OAuthError, JoseError):
+        # JoseError: id_token 검증 실패 (서명, nonce/iss/exp 클레임 등)
+        raise HTTPException(status_code=401, detail="OAuth authentication failed")
+    except httpx.HTTPError:
+        # 타임아웃, 연결 실패 등 Google과의 통신 오류
+        raise HTTPException(status_code=503, detail="Google OAuth temporarily unavailable")
+    
+    # 사용자 정보 가져오기
+    user_info = token.get('userinfo')
+    if not user_info:
+        raise HTTPException(status_code=400, detail="Failed to get user info")
+    
+    google_id = user_info.get('sub')
+    email = user_info.get('email')
+    if not google_id or not email:
+        raise HTTPException(status_code=400, detail="Failed to get user info")
+    name = user_info.get('name') or email.split('@')[0]
+    
+    # DB에 사용자 정보 저장/업데이트
+    try:
         user_id = await upsert_user(db, google_id, email, name)
-        
-        # JWT 액세스 토큰 생성
-        access_token = create_access_token(data={"user_id": user_id})
-        
-        return {
-            "access_token": access_token,
-            "token_type": "bearer",
-            "user": {
-                "id": user_id,
-                "email": email,
-                "name": name
-            }
+    except SQLAlchemyError:
+        await db.rollback()
+        raise HTTPException(status_code=503, detail="Database temporarily unavailable")
+    
+    # JWT 액세스 토큰 생성 (/auth/me가 DB 조회 없이 응답하도록 프로필 포함)
+    access_token = create_access_token(
+        data={"user_id": user_id, "email": email, "name": name}
+    )
+    
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": {
+            "id": user_id,
+            "email": email,
+            "name": name
         }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"OAuth callback failed: {str(e)}"
-        )
+    }
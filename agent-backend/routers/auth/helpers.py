@@ -1,51 +1,81 @@
 """
 Auth 헬퍼 함수들
 """
-import uuid
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from typing import Optional
+from typing import Optional, List
+
+# 사용자 정보 캐시 (키: user_id 문자열)
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+
+# SQL 문 (모듈 로드 시 한 번만 생성)
+# 단건/일괄 upsert가 같은 쿼리를 쓰도록 본문을 공유
+_UPSERT_USER_SQL = """
+    INSERT INTO users (google_id, email, name, created_at, updated_at)
+    VALUES (:google_id, :email, :name, NOW(), NOW())
+    ON CONFLICT (google_id) DO UPDATE
+       SET email = EXCLUDED.email, name = EXCLUDED.name, updated_at = NOW()
+"""
+
+_SQL_UPSERT_USER = text(_UPSERT_USER_SQL + "RETURNING id")
+
+# 일괄 upsert용 (executemany에서는 RETURNING 결과를 받을 수 없으므로 제외)
+_SQL_BULK_UPSERT_USER = text(_UPSERT_USER_SQL)
+
+_SQL_GET_USER = text("""
+    SELECT id, sid, google_id, email, name, created_at, updated_at
+    FROM users
+    WHERE id = :user_id
+""")
 
 
 async def upsert_user(db: AsyncSession, google_id: str, email: str, name: str) -> str:
     """
     사용자 정보를 DB에 upsert (비동기)
     
+    INSERT ... ON CONFLICT 단일 쿼리로 처리합니다.
+    (users.google_id UNIQUE 인덱스 필요: migrations/001_users_google_id_unique.sql)
+    
     Returns:
         user_id: BIGINT (자동 증가 ID의 문자열 표현)
     """
-    # google_id로 기존 사용자 조회 (users 테이블)
+    # 신규 사용자는 생성 (id와 sid는 DB에서 자동 생성), 기존 사용자는 이메일/이름 업데이트
     result = await db.execute(
-        text("SELECT id FROM users WHERE google_id = :google_id"),
-        {"google_id": google_id}
+        _SQL_UPSERT_USER,
+        {"google_id": google_id, "email": email, "name": name}
     )
-    existing_user = result.fetchone()
-
-    if existing_user:
-        # 기존 사용자 - 이메일, 이름 업데이트
-        await db.execute(
-            text("""
-                UPDATE users
-                SET email = :email, name = :name, updated_at = NOW()
-                WHERE google_id = :google_id
-            """),
-            {"email": email, "name": name, "google_id": google_id}
-        )
-        await db.commit()
-        return str(existing_user[0])  # BIGINT를 문자열로 변환
-    else:
-        # 신규 사용자 생성 (id와 sid는 DB에서 자동 생성)
-        result = await db.execute(
-            text("""
-                INSERT INTO users (google_id, email, name, created_at, updated_at)
-                VALUES (:google_id, :email, :name, NOW(), NOW())
-                RETURNING id
-            """),
-            {"google_id": google_id, "email": email, "name": name}
-        )
-        new_user = result.fetchone()
-        await db.commit()
-        return str(new_user[0])  # BIGINT를 문자열로 변환
+    user_id = str(result.scalar_one())  # BIGINT를 문자열로 변환
+    await db.commit()
+    _user_cache.pop(user_id, None)
+    return user_id
+
+
+async def bulk_upsert_users(db: AsyncSession, rows: List[dict]) -> int:
+    """
+    여러 사용자 정보를 한 트랜잭션으로 일괄 upsert (비동기)
+    
+    사용자마다 upsert_user를 호출하는 대신 executemany + 단일 commit으로 처리합니다.
+    
+    Args:
+        rows: {"google_id", "email", "name"} 딕셔너리 목록
+    
+    Returns:
+        처리한 행 수
+    """
+    if not rows:
+        return 0
+
+    params = [
+        {"google_id": row["google_id"], "email": row["email"], "name": row["name"]}
+        for row in rows
+    ]
+    await db.execute(_SQL_BULK_UPSERT_USER, params)
+    await db.commit()
+
+    # 어떤 user_id가 갱신됐는지 알 수 없으므로 캐시 전체 무효화
+    _user_cache.clear()
+    return len(params)
 
 
 async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[dict]:
@@ -55,24 +85,38 @@ async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[dict]:
     users 테이블에서 기본 정보를 조회합니다.
     """
     result = await db.execute(
-        text("""
-            SELECT id, sid, google_id, email, name, created_at, updated_at
-            FROM users
-            WHERE id = :user_id
-        """),
-        {"user_id": user_id}
+        _SQL_GET_USER,
+        {"user_id": int(user_id)}  # asyncpg는 BIGINT 파라미터에 정수만 허용
     )
-    row = result.fetchone()
+    row = result.mappings().first()
 
     if not row:
         return None
 
-    return {
-        "id": str(row[0]),  # BIGINT
-        "sid": str(row[1]) if row[1] else None,  # UUID
-        "google_id": row[2],
-        "email": row[3],
-        "name": row[4],
-        "created_at": row[5].isoformat() if row[5] else None,
-        "updated_at": row[6].isoformat() if row[6] else None
-    }
+    # 컬럼명 기반 매핑 (위치 인덱스 대신 row._mapping 사용)
+    # sid(UUID), created_at/updated_at(datetime)은 ORJSONResponse가 직렬화
+    user = dict(row)
+    user["id"] = str(user["id"])  # BIGINT
+    return user
+
+
+async def get_user_by_id_cached(
+    db: AsyncSession,
+    user_id: str,
+    refresh: bool = False
+) -> Optional[dict]:
+    """
+    ID로 사용자 정보 조회 (캐시 사용)
+
+    캐시에 없을 때만 DB를 조회합니다.
+    반환된 dict는 캐시와 공유되므로 수정하지 마세요.
+
+    Args:
+        refresh: True이면 캐시를 건너뛰고 DB에서 조회한 뒤 캐시를 갱신
+    """
+    user = None if refresh else _user_cache.get(user_id)
+    if user is None:
+        user = await get_user_by_id(db, user_id)
+        if user:
+            _user_cache[user_id] = user
+    return user
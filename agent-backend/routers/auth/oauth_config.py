@@ -1,17 +1,115 @@
 """
 OAuth 설정
 """
+import asyncio
+import time
+import httpx
+from typing import Optional
 from authlib.integrations.starlette_client import OAuth
 import config
 
+GOOGLE_DISCOVERY_URL = 'https://accounts.google.com/.well-known/openid-configuration'
+
+# Google 메타데이터(discovery 문서, JWKS) 갱신 주기 (초)
+METADATA_REFRESH_INTERVAL = 24 * 60 * 60
+
+
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    """
+    여러 OAuth 클라이언트가 공유하는 keep-alive 트랜스포트
+
+    Authlib은 요청마다 httpx 클라이언트를 새로 만들고 닫으므로,
+    클라이언트 종료 시 커넥션 풀이 닫히지 않도록 막아 TLS 연결을 재사용합니다.
+    """
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        """앱 종료 시 실제 커넥션 풀 정리"""
+        await super().aclose()
+
+
+# Google 토큰 교환/메타데이터 조회용 공유 트랜스포트
+oauth_transport = _SharedTransport(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+
 # Authlib OAuth 설정
 oauth = OAuth()
 oauth.register(
     name='google',
     client_id=config.GOOGLE_CLIENT_ID,
     client_secret=config.GOOGLE_CLIENT_SECRET,
-    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+    server_metadata_url=GOOGLE_DISCOVERY_URL,
     client_kwargs={
-        'scope': 'openid email profile'
+        'scope': 'openid email profile',
+        'timeout': 10,
+        'transport': oauth_transport
     }
 )
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def refresh_google_metadata() -> None:
+    """
+    Google OpenID discovery 문서와 JWKS를 불러와 캐시
+
+    Authlib은 server_metadata에 캐시된 값을 사용하므로,
+    로그인 콜백에서 Google 메타데이터 요청이 발생하지 않습니다.
+    두 요청이 모두 성공한 경우에만 캐시를 교체하므로, 실패 시 기존 캐시가 유지됩니다.
+    """
+    async with httpx.AsyncClient(transport=oauth_transport, timeout=10) as http:
+        resp = await http.get(GOOGLE_DISCOVERY_URL)
+        resp.raise_for_status()
+        metadata = resp.json()
+
+        jwks_uri = metadata.get('jwks_uri')
+        if not jwks_uri:
+            raise RuntimeError('Missing "jwks_uri" in Google discovery document')
+        resp = await http.get(jwks_uri)
+        resp.raise_for_status()
+        jwk_set = resp.json()
+
+    # Authlib과 같은 키로 저장 (_loaded_at이 있으면 load_server_metadata가 재요청하지 않음)
+    metadata['jwks'] = jwk_set
+    metadata['_loaded_at'] = time.time()
+    oauth.google.server_metadata.update(metadata)
+
+
+async def _refresh_loop() -> None:
+    """주기적으로 Google 메타데이터 갱신 (실패 시 기존 캐시 유지)"""
+    while True:
+        await asyncio.sleep(METADATA_REFRESH_INTERVAL)
+        try:
+            await refresh_google_metadata()
+        except Exception as e:
+            print(f"[OAuth] Failed to refresh Google metadata: {e}")
+
+
+async def start_metadata_refresh() -> None:
+    """앱 시작 시 메타데이터를 미리 불러오고 주기적 갱신 시작"""
+    global _refresh_task
+    try:
+        await refresh_google_metadata()
+    except Exception as e:
+        # 실패해도 첫 로그인 시 Authlib이 지연 로딩하므로 시작은 계속 진행
+        print(f"[OAuth] Failed to prefetch Google metadata: {e}")
+    _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_metadata_refresh() -> None:
+    """주기적 갱신 중지"""
+    global _refresh_task
+    if _refresh_task:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
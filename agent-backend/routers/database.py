@@ -1,49 +1,83 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from fastapi import APIRouter, HTTPException
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy import text
+from sqlalchemy.pool import NullPool
 from typing import AsyncGenerator
+from uuid import uuid4
 import config
 
 router = APIRouter()
 
+_SQL_PING = text("SELECT 1")
+
+
+def _to_async_url(url: str) -> str:
+    """postgresql:// -> postgresql+asyncpg:// 로 변경"""
+    if url and url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+# asyncpg의 prepared statement 캐시는 PgBouncer 트랜잭션 모드와 호환되지 않으므로 비활성화
+# (백엔드 커넥션이 트랜잭션마다 바뀌므로 statement 이름도 매번 고유하게 생성)
+_CONNECT_ARGS = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+}
+
+
 # 비동기 엔진 생성
-# postgresql:// -> postgresql+psycopg:// 로 변경 (PgBouncer 호환)
-DATABASE_URL = config.DATABASE_URL
-if DATABASE_URL and DATABASE_URL.startswith("postgresql://"):
-    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
+DATABASE_URL = _to_async_url(config.DATABASE_URL)
 
+# 풀링은 PgBouncer(트랜잭션 모드)에서 중앙 관리 - 워커별 풀은 최소한으로 유지
+# pool_pre_ping은 체크아웃마다 SELECT 1로 트랜잭션을 열어 "idle in transaction"을 남기므로 끔
+# pool_recycle은 PgBouncer server_idle_timeout보다 짧게 유지
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,
-    pool_size=20,
-    max_overflow=10
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_pre_ping=False,
+    pool_recycle=60,
+    pool_timeout=30,
+    connect_args=_CONNECT_ARGS
 )
 
-# 비동기 세션 팩토리
-AsyncSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+# 헬스체크 전용 엔진 (PgBouncer를 거치지 않는 직접 연결, 풀 미사용)
+health_engine = create_async_engine(
+    _to_async_url(config.DIRECT_DATABASE_URL or config.DATABASE_URL),
+    echo=False,
+    poolclass=NullPool,
+    connect_args=_CONNECT_ARGS
+)
+
+# 비동기 세션 팩토리 (조회 위주이므로 autoflush 비활성화)
+AsyncSessionLocal = async_sessionmaker(
+    engine, expire_on_commit=False, autoflush=False
 )
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     비동기 DB 세션 의존성 주입
+
+    async with 블록 종료 시 세션이 자동으로 닫힙니다.
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 @router.get("/check-db")
-async def check_db_connection(db: AsyncSession = Depends(get_db)):
+async def check_db_connection():
     """
     데이터베이스 연결 상태를 확인합니다.
+
+    PgBouncer 풀을 점유하지 않도록 직접 연결(DIRECT_DATABASE_URL)로 확인합니다.
     """
     try:
         # 간단한 쿼리 실행 (연결 테스트)
-        result = await db.execute(text("SELECT 1"))
-        value = result.scalar()
+        async with health_engine.connect() as conn:
+            result = await conn.execute(_SQL_PING)
+            value = result.scalar()
             
         return {
             "status": "success",
@@ -1,13 +1,12 @@
 """
 FastAPI Dependencies - 인증 및 유저 정보
 """
-from fastapi import Depends, HTTPException, Header
+from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
-from utils.jwt import verify_token
+from utils.jwt import verify_token_cached
 from routers.database import get_db
-from routers.auth.helpers import get_user_by_id  # 순환 import 방지
+from routers.auth.helpers import get_user_by_id_cached  # 순환 import 방지
 
 # HTTPBearer security scheme (Swagger UI용)
 security = HTTPBearer()
@@ -29,7 +28,7 @@ async def get_current_user_id(
         HTTPException: 인증 실패 시
     """
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
     
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
@@ -56,10 +55,9 @@ async def get_current_user(
         사용자 정보 딕셔너리 (id는 정수형)
     """
     # DB에는 문자열로 전달
-    user = await get_user_by_id(db, str(user_id))
+    user = await get_user_by_id_cached(db, str(user_id))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # id를 정수로 변환
-    user["id"] = int(user["id"])
-    return user
+    # id를 정수로 변환 (캐시된 dict는 복사 후 수정)
+    return {**user, "id": int(user["id"])}
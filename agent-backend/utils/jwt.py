@@ -2,11 +2,18 @@
 JWT 토큰 유틸리티
 """
 
+import hashlib
+import time
 import jwt
+from cachetools import TTLCache
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 import config
 
+# 검증된 토큰 payload 캐시 (키: 토큰의 sha256 해시, 원본 토큰은 저장하지 않음)
+# ⚠️ 토큰 폐기가 반영되기까지 최대 TTL(30초)만큼 지연될 수 있음
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -58,3 +65,30 @@ def verify_token(token: str) -> Optional[dict]:
         return None
     except jwt.InvalidTokenError:
         return None
+
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """
+    JWT 토큰 검증 (캐시 사용)
+
+    동일 토큰의 반복 요청 시 서명 검증을 생략합니다.
+    캐시된 payload도 만료 시각(exp)이 지나면 사용하지 않습니다.
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        디코딩된 payload (dict) 또는 None (검증 실패 시)
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _token_cache.pop(key, None)
+
+    payload = verify_token(token)
+    if payload:
+        _token_cache[key] = payload
+    return payload